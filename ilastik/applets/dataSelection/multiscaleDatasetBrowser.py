@@ -30,6 +30,9 @@ Todos:
 
 import logging
 import pathlib
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 from requests.exceptions import SSLError, ConnectionError
 from PyQt5.QtCore import QTimer
@@ -46,12 +49,18 @@ from PyQt5.QtWidgets import (
 )
 
 from lazyflow.utility import isUrl
+from lazyflow.utility.io_util.multiscaleStore import MultiscaleStore
 from lazyflow.utility.io_util.OMEZarrStore import OMEZarrStore
 from lazyflow.utility.io_util.RESTfulPrecomputedChunkedVolume import RESTfulPrecomputedChunkedVolume
 from lazyflow.utility.pathHelpers import uri_to_Path
 
 logger = logging.getLogger(__name__)
 
+# Successfully probed stores, so that checking the same address again does not refetch metadata
+PROBE_CACHE_TTL_SECONDS = 60
+PROBE_CACHE_MAX_ENTRIES = 16
+_PROBE_CACHE: Dict[str, Tuple[float, MultiscaleStore]] = {}
+
 
 def _validate_uri(text: str) -> str:
     """Make sure the input is a URI, convert if it's a path, ensure path exists if it's a 'file:' URI already.
@@ -75,6 +84,46 @@ def _validate_uri(text: str) -> str:
     return text
 
 
+def _probe_cache_key(uri: str) -> str:
+    parts = urlsplit(uri)
+    return urlunsplit(parts._replace(path=parts.path.rstrip("/")))
+
+
+def _instantiate_store(uri: str) -> Optional[MultiscaleStore]:
+    # Ask each store type if it likes the URL to avoid web requests during instantiation attempts.
+    if OMEZarrStore.is_uri_compatible(uri):
+        return OMEZarrStore(uri)
+    elif RESTfulPrecomputedChunkedVolume.is_uri_compatible(uri):
+        return RESTfulPrecomputedChunkedVolume(volume_url=uri)
+    return None
+
+
+def _probe_store(uri: str) -> Optional[MultiscaleStore]:
+    """Instantiate the store type that is compatible with uri, reusing recent results for the same remote address.
+    Local (file:) stores are cheap to probe and may have just been re-exported, so they are never cached.
+    Returns None if no store type claims the URI. Errors during instantiation are raised and not cached."""
+    if uri.startswith("file:"):
+        return _instantiate_store(uri)
+
+    key = _probe_cache_key(uri)
+    now = time.monotonic()
+    for cached_key, (timestamp, _) in list(_PROBE_CACHE.items()):
+        if now - timestamp > PROBE_CACHE_TTL_SECONDS:
+            del _PROBE_CACHE[cached_key]
+    if key in _PROBE_CACHE:
+        logger.debug(f"Reusing store for {uri} probed {now - _PROBE_CACHE[key][0]:.1f}s ago.")
+        return _PROBE_CACHE[key][1]
+
+    rv = _instantiate_store(uri)
+    if rv is None:
+        return None
+
+    if len(_PROBE_CACHE) >= PROBE_CACHE_MAX_ENTRIES:
+        del _PROBE_CACHE[next(iter(_PROBE_CACHE))]  # Oldest entry
+    _PROBE_CACHE[key] = (now, rv)
+    return rv
+
+
 class MultiscaleDatasetBrowser(QDialog):
 
     EXAMPLE_URI = "https://data.ilastik.org/2d_cells_apoptotic_1channel.zarr"
@@ -162,12 +211,8 @@ class MultiscaleDatasetBrowser(QDialog):
             self.combo.lineEdit().setText(uri)
         logger.debug(f"Entered URL: {uri}")
         try:
-            # Ask each store type if it likes the URL to avoid web requests during instantiation attempts.
-            if OMEZarrStore.is_uri_compatible(uri):
-                rv = OMEZarrStore(uri)
-            elif RESTfulPrecomputedChunkedVolume.is_uri_compatible(uri):
-                rv = RESTfulPrecomputedChunkedVolume(volume_url=uri)
-            else:
+            rv = _probe_store(uri)
+            if rv is None:
                 store_types = [OMEZarrStore, RESTfulPrecomputedChunkedVolume]
                 supported_formats = "\n".join(f"<li>{s.NAME} ({s.URI_HINT})</li>" for s in store_types)
                 self.result_text_box.setHtml(
@@ -20,13 +20,17 @@
 #          http://ilastik.org/license/
 ###############################################################################
 import os
+from functools import partial
 
 from lazyflow.graph import Operator, InputSlot, OutputSlot
 from lazyflow.operators.generic import OpMultiArrayStacker
-from lazyflow.operators.ioOperators.opStreamingH5N5Reader import OpStreamingH5N5Reader
-from lazyflow.utility.pathHelpers import PathComponents, globH5N5
+from lazyflow.operators.ioOperators.opStreamingH5N5Reader import OpStreamingH5N5Reader, _find_or_infer_axistags
+from lazyflow.request import Request, RequestPool
+from lazyflow.utility.helpers import bigintprod
+from lazyflow.utility.pathHelpers import PathComponents, globH5N5Multi
 
 import h5py
+import vigra
 import z5py
 import logging
 
@@ -61,6 +65,10 @@ class OpStreamingH5N5SequenceReaderS(Operator):
     SequenceAxis = InputSlot(optional=True)  # The axis to stack across.
     OutputImage = OutputSlot()
 
+    # Read all datasets directly in execute instead of wiring one OpStreamingH5N5Reader per dataset
+    # into an OpMultiArrayStacker. Avoids one operator per dataset (and their slot hops on every request).
+    USE_VIRTUAL_STACKER = True
+
     class WrongFileTypeError(Exception):
         def __init__(self, globString):
             self.filename = globString
@@ -85,6 +93,12 @@ class OpStreamingH5N5SequenceReaderS(Operator):
             )
             super().__init__(self.msg)
 
+    class FileOpenError(Exception):
+        def __init__(self, fileName):
+            self.fileName = fileName
+            self.msg = f"Could not read file: {fileName}"
+            super().__init__(self.msg)
+
     class NotTheSameFileError(Exception):
         def __init__(self, globString):
             self.globString = globString
@@ -107,6 +121,12 @@ class OpStreamingH5N5SequenceReaderS(Operator):
         super().__init__(*args, **kwargs)
         self._h5N5File = None
         self._readers = []
+        self._datasets = []
+        self._stack_axis_index = 0
+        self._stack_axis_is_new = True
+        # Glob expansion walks the whole file tree; only redo it when the glob string changes
+        self._cached_glob_string = None
+        self._cached_file_paths = []
         self._opStacker = OpMultiArrayStacker(parent=self)
         self._opStacker.AxisIndex.setValue(0)
 
@@ -114,6 +134,7 @@ class OpStreamingH5N5SequenceReaderS(Operator):
         self._opStacker.Images.resize(0)
         for opReader in self._readers:
             opReader.cleanUp()
+        self._datasets = []
         if self._h5N5File is not None:
             assert isinstance(self._h5N5File, (h5py.File, z5py.N5File)), "_h5N5File should not be of any other type"
             self._h5N5File.close()
@@ -123,8 +144,11 @@ class OpStreamingH5N5SequenceReaderS(Operator):
     def setupOutputs(self):
         pcs = PathComponents(self.GlobString.value.split(os.path.pathsep)[0])
         self._h5N5File = OpStreamingH5N5Reader.get_h5_n5_file(pcs.externalPath, mode="r")
-        self.checkGlobString(self.GlobString.value)
-        file_paths = self.expandGlobStrings(self._h5N5File, self.GlobString.value)
+        if self.GlobString.value != self._cached_glob_string:
+            self.checkGlobString(self.GlobString.value)
+            self._cached_file_paths = self.expandGlobStrings(self._h5N5File, self.GlobString.value)
+            self._cached_glob_string = self.GlobString.value
+        file_paths = self._cached_file_paths
 
         num_files = len(file_paths)
         if num_files == 0:
@@ -132,17 +156,9 @@ class OpStreamingH5N5SequenceReaderS(Operator):
             self.OutputImage.meta.NOTREADY = True
             return
 
-        self.OutputImage.connect(self._opStacker.Output)
-        # Get slice axes from first image
-        try:
-            opFirstImg = OpStreamingH5N5Reader(parent=self)
-            opFirstImg.InternalPath.setValue(file_paths[0])
-            opFirstImg.H5N5File.setValue(self._h5N5File)
-            slice_axes = opFirstImg.OutputImage.meta.getAxisKeys()
-            opFirstImg.cleanUp()
-        except RuntimeError as e:
-            logger.error(str(e))
-            raise OpStreamingH5N5SequenceReaderS.FileOpenError(file_paths[0]) from e
+        # Get slice axes from first image (the same way OpStreamingH5N5Reader determines them)
+        slice_axistags = _find_or_infer_axistags(self._h5N5File, file_paths[0])
+        slice_axes = slice_axistags.keys()
 
         # Use given new axis or try to do something sensible
         if self.SequenceAxis.ready():
@@ -160,6 +176,11 @@ class OpStreamingH5N5SequenceReaderS(Operator):
                 # Stack across first existing axis
                 new_axis = slice_axes[0]
 
+        if self.USE_VIRTUAL_STACKER:
+            self._setupVirtualStack(pcs.externalPath, file_paths, slice_axistags, new_axis)
+            return
+
+        self.OutputImage.connect(self._opStacker.Output)
         self._opStacker.Images.resize(0)
         self._opStacker.Images.resize(num_files)
         self._opStacker.AxisFlag.setValue(new_axis)
@@ -193,6 +214,79 @@ class OpStreamingH5N5SequenceReaderS(Operator):
                 stacker_slot.connect(opReader.OutputImage)
                 self._readers.append(opReader)
 
+    def _setupVirtualStack(self, externalPath, file_paths, axistags, new_axis):
+        """Configure OutputImage like OpMultiArrayStacker would: A new axis is inserted in front,
+        an existing axis is concatenated."""
+        datasets = [self._h5N5File[path] for path in file_paths]
+        first = datasets[0]
+        for path, dataset in zip(file_paths, datasets):
+            # Abort if the image-stack has no consistent dtype or shape
+            if dataset.dtype != first.dtype:
+                raise OpStreamingH5N5SequenceReaderS.InconsistentDType(externalPath, path)
+            if dataset.shape != first.shape:
+                raise OpStreamingH5N5SequenceReaderS.InconsistentShape(externalPath, path)
+
+        assert len(axistags) == len(first.shape), f"Mismatch between shape {first.shape} and axis tags {axistags}"
+
+        shape = list(first.shape)
+        chunks = first.chunks
+        if new_axis in axistags.keys():
+            self._stack_axis_is_new = False
+            self._stack_axis_index = axistags.index(new_axis)
+            shape[self._stack_axis_index] *= len(datasets)
+        else:
+            self._stack_axis_is_new = True
+            self._stack_axis_index = 0
+            axistags.insert(0, vigra.defaultAxistags(new_axis)[0])
+            shape.insert(0, len(datasets))
+            if chunks:
+                chunks = (1,) + tuple(chunks)
+        self._datasets = datasets
+
+        self.OutputImage.disconnect()
+        self.OutputImage.meta.dtype = first.dtype.type
+        self.OutputImage.meta.shape = tuple(shape)
+        self.OutputImage.meta.axistags = axistags
+        if "drange" in first.attrs:
+            self.OutputImage.meta.drange = tuple(first.attrs["drange"])
+        if "display_mode" in first.attrs:
+            self.OutputImage.meta.display_mode = str(first.attrs["display_mode"])
+        if not chunks and bigintprod(first.shape) > 1e8:
+            self.OutputImage.meta.inefficient_format = True
+        if chunks:
+            self.OutputImage.meta.ideal_blockshape = chunks
+
+    def execute(self, slot, subindex, roi, result):
+        axis = self._stack_axis_index
+        slices_per_dataset = 1 if self._stack_axis_is_new else self._datasets[0].shape[axis]
+        start, stop = roi.start[axis], roi.stop[axis]
+        first_dataset = start // slices_per_dataset
+        last_dataset = (stop - 1) // slices_per_dataset
+        key = list(roi.toSlice())
+        pool = RequestPool()
+        for i in range(first_dataset, last_dataset + 1):
+            dataset_start = i * slices_per_dataset
+            overlap_start = max(start, dataset_start)
+            overlap_stop = min(stop, dataset_start + slices_per_dataset)
+            result_key = [slice(None)] * len(key)
+            dataset_key = list(key)
+            if self._stack_axis_is_new:
+                result_key[axis] = overlap_start - start
+                del dataset_key[axis]
+            else:
+                result_key[axis] = slice(overlap_start - start, overlap_stop - start)
+                dataset_key[axis] = slice(overlap_start - dataset_start, overlap_stop - dataset_start)
+            read_fn = partial(self._read_dataset, self._datasets[i], tuple(dataset_key), result[tuple(result_key)])
+            pool.add(Request(read_fn))
+        pool.wait()
+
+    @staticmethod
+    def _read_dataset(dataset, key, result):
+        if result.flags.c_contiguous:
+            dataset.read_direct(result, key)
+        else:
+            result[...] = dataset[key]
+
     def propagateDirty(self, slot, subindex, roi):
         if slot == self.GlobString or slot == self.SequenceAxis:
             self.OutputImage.setDirty(slice(None))
@@ -215,12 +309,12 @@ class OpStreamingH5N5SequenceReaderS(Operator):
                 ret = OpStreamingH5N5SequenceReaderS.expandGlobStrings(f, globStrings)
             return ret
 
+        # Parse list into separate globstrings and combine their matches in the given order
+        internalGlobs = [PathComponents(s.strip()).internalPath.lstrip("/") for s in globStrings.split(os.path.pathsep)]
+        matches = globH5N5Multi(h5N5File, internalGlobs)
         ret = []
-        # Parse list into separate globstrings and combine them
-        for globString in globStrings.split(os.path.pathsep):
-            s = globString.strip()
-            components = PathComponents(s)
-            ret += sorted(globH5N5(h5N5File, components.internalPath.lstrip("/")))
+        for internalGlob in internalGlobs:
+            ret += matches[internalGlob]
         return ret
 
     @staticmethod
@@ -31,7 +31,17 @@ from .singleton import Singleton
 from .orderedSignal import OrderedSignal
 from .fileLock import FileLock
 from .tracer import Tracer, traceLogged
-from .pathHelpers import PathComponents, getPathVariants, isUrl, make_absolute, globH5N5, globList, mkdir_p, lsH5N5
+from .pathHelpers import (
+    PathComponents,
+    getPathVariants,
+    isUrl,
+    make_absolute,
+    globH5N5,
+    globH5N5Multi,
+    globList,
+    mkdir_p,
+    lsH5N5,
+)
 
 from .roiRequestBatch import RoiRequestBatch, RoiRequestBatchException
 from .roiRequestBuffer import RoiRequestBufferIter
@@ -95,7 +95,14 @@ class BigRequestStreamer(object):
     """
 
     def __init__(
-        self, outputSlot, roi, blockshape=None, batchSize=None, blockAlignment="absolute", allowParallelResults=False
+        self,
+        outputSlot,
+        roi,
+        blockshape=None,
+        batchSize=None,
+        blockAlignment="absolute",
+        allowParallelResults=False,
+        blockMultiple=None,
     ):
         """
         Constructor.
@@ -107,6 +114,9 @@ class BigRequestStreamer(object):
         :param blockAlignment: Determines how block the requests. Choices are 'absolute' or 'relative'.
         :param allowParallelResults: If False, The resultSignal will not be called in parallel.
                                      In that case, your handler function has no need for locks.
+        :param blockMultiple: If given (and blockshape is omitted), the default blockshape is rounded to multiples of
+                              this shape, e.g. the chunk shape of the storage results are written to.
+                              With absolute alignment, no two requests then touch the same chunk.
         """
         self._outputSlot = outputSlot
         self._bigRoi = roi
@@ -119,6 +129,11 @@ class BigRequestStreamer(object):
 
         if blockshape is None:
             blockshape = self._determine_blockshape(outputSlot)
+            if blockMultiple is not None:
+                blockshape = tuple(
+                    max(1, int(round(size / multiple))) * multiple for size, multiple in zip(blockshape, blockMultiple)
+                )
+                logger.info("Rounded blockshape to multiples of {}: {}".format(tuple(blockMultiple), blockshape))
 
         assert blockAlignment in ["relative", "absolute"]
         if blockAlignment == "relative":
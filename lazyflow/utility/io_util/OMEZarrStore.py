@@ -314,8 +314,11 @@ def _try_authenticated_s3_compatible(uri, kwargs, e, test_path) -> FSStore:
     return store
 
 
-def _ensure_connection_and_get_store(uri: str, mode="r", **kwargs) -> FSStore:
+def _connect_and_read_test_file(uri: str, mode="r", **kwargs) -> Tuple[FSStore, Optional[bytes]]:
+    """Returns the store, and the contents of .zattrs if reading it succeeded on the first attempt.
+    Passing these on saves callers that need .zattrs anyway from requesting it a second time."""
     test_path = ".zattrs"
+    test_file = None
     if uri.startswith("file:"):
         # Zarr's FSStore implementation doesn't unescape file URLs before piping them to
         # the file system. We do it here the same way as in pathHelpers.uri_to_Path.
@@ -328,7 +331,9 @@ def _ensure_connection_and_get_store(uri: str, mode="r", **kwargs) -> FSStore:
         # Non-S3 don't like to be called with anon keyword
         store = FSStore(uri, mode=mode, **kwargs)
     try:
-        store[test_path]
+        with Timer() as timer:
+            test_file = store[test_path]
+        logger.info(f"Reading OME-Zarr metadata from {uri}/{test_path} took {timer.seconds()*1000} ms.")
         # Any error not handled here is either a successful connection (even 404), or an unknown problem
     except (KeyError, ClientResponseError) as e:
         # FSStore wraps some errors in KeyError (FileNotFoundError even double-wrapped)
@@ -344,7 +349,13 @@ def _ensure_connection_and_get_store(uri: str, mode="r", **kwargs) -> FSStore:
         if isinstance(e, ClientResponseError) and e.status == 403:
             # Server requires authentication. Try if it's an S3-compatible store.
             store = _try_authenticated_s3_compatible(uri, kwargs, e, test_path)
-    return store
+    return store, test_file
+
+
+def _reopen_with_kwargs(store: FSStore, **kwargs) -> FSStore:
+    """New FSStore at the same location with the same (possibly authenticated) filesystem,
+    e.g. to apply version-specific kwargs once the OME-Zarr version is known, without connecting again."""
+    return FSStore(store.path, fs=store.fs, mode=store.mode, **kwargs)
 
 
 def _parse_ome_zarr_labels(spec: Dict, uri: str) -> List[str]:
@@ -423,15 +434,18 @@ def _check_non_multiscale_specs(spec: Dict, uri: str, sort_uri: Optional[str] =
     )
 
 
-def _fetch_and_validate_ome_zarr_spec(uri: str, sort_uri: Optional[str] = None) -> OME_ZARR_SPEC:
+def _fetch_and_validate_ome_zarr_spec(uri: str, sort_uri: Optional[str] = None) -> Tuple[OME_ZARR_SPEC, FSStore]:
     """Fetch uri/.zattrs and validate it against OME-Zarr spec.
+    Returns the spec and the store it was read from, so that callers can reuse the connection.
     :param sort_uri: If the spec at `uri` is not multiscale but plate, well or labels,
         the URIs in the response text are reordered to first show those including `uri`."""
-    store = _ensure_connection_and_get_store(uri)
+    store, zattrs = _connect_and_read_test_file(uri)
     try:
-        with Timer() as timer:
-            spec = json.loads(store[".zattrs"])
+        if zattrs is None:  # First attempt failed, but the store may have switched to authenticated access
+            with Timer() as timer:
+                zattrs = store[".zattrs"]
             logger.info(f"Reading OME-Zarr metadata from {uri}/.zattrs took {timer.seconds()*1000} ms.")
+        spec = json.loads(zattrs)
     except KeyError as e:
         try:
             # Metadata file is called zarr.json since OME-Zarr v0.5 (zarr v3)
@@ -462,16 +476,16 @@ def _fetch_and_validate_ome_zarr_spec(uri: str, sort_uri: Optional[str] = None)
             f"\nFull metadata received:\n{spec}"
         )
         raise NoOMEZarrMetaFound(err_msg)
-    return spec
+    return spec, store
 
 
-def _introspect_for_multiscales_root(uri: str) -> Tuple[OME_ZARR_SPEC, str, Optional[str]]:
+def _introspect_for_multiscales_root(uri: str) -> Tuple[OME_ZARR_SPEC, FSStore, str, Optional[str]]:
     """URI may point to an OME-Zarr multiscale root or to a specific scale.
     Try to find OME-Zarr spec first at URI, then search parent directories.
-    Returns spec and root URI of the validated multiscales spec, and scale sub-URI (if any)"""
+    Returns spec, store and root URI of the validated multiscales spec, and scale sub-URI (if any)"""
     uri = uri.rstrip("/")
     try:
-        return _fetch_and_validate_ome_zarr_spec(uri), uri, None
+        return *_fetch_and_validate_ome_zarr_spec(uri), uri, None
     except NoOMEZarrMetaFound:
         if ZARR_EXT in uri.split("/")[-1]:
             raise
@@ -483,7 +497,7 @@ def _introspect_for_multiscales_root(uri: str) -> Tuple[OME_ZARR_SPEC, str, Opti
             sub_uri = uri[i + 1 :]
             try:
                 return (
-                    _fetch_and_validate_ome_zarr_spec(uri_to_parent, uri),
+                    *_fetch_and_validate_ome_zarr_spec(uri_to_parent, uri),
                     uri_to_parent,
                     sub_uri,
                 )
@@ -512,7 +526,7 @@ class OMEZarrStore(MultiscaleStore):
     URI_HINT = f'URL contains "{ZARR_EXT}"'
 
     def __init__(self, uri: str, target_scale: Optional[str] = None, single_scale_mode: bool = False):
-        self._ome_spec, self.base_uri, self.scale_sub_path = _introspect_for_multiscales_root(uri)
+        self._ome_spec, root_store, self.base_uri, self.scale_sub_path = _introspect_for_multiscales_root(uri)
         selected_scale = target_scale or self.scale_sub_path
         if len(self._ome_spec["multiscales"]) > 1 and not selected_scale:
             warn = (
@@ -537,10 +551,11 @@ class OMEZarrStore(MultiscaleStore):
             )
         axistags = _axistags_from_multiscale(self._multiscale_spec)
         datasets = self._multiscale_spec["datasets"]
+        # Reuse the connection established while reading the spec instead of probing the store again
         if self._multiscale_spec["version"] == "0.1":
-            uncached_store = _ensure_connection_and_get_store(self.base_uri, **OME_ZARR_V_0_1_KWARGS)
+            uncached_store = _reopen_with_kwargs(root_store, **OME_ZARR_V_0_1_KWARGS)
         else:
-            uncached_store = _ensure_connection_and_get_store(self.base_uri, **OME_ZARR_V_0_4_KWARGS)
+            uncached_store = _reopen_with_kwargs(root_store, **OME_ZARR_V_0_4_KWARGS)
         # There is an additional block cache in front of OpOMEZarrMultiscaleReader, so e.g. when
         # the user scrolls across z back and forth, this does not trigger requests to the store.
         # But blocks can be misaligned with file size in the store. This cache can prevent downloading
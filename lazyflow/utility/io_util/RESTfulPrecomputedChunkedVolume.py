@@ -22,12 +22,14 @@
 import json
 import logging
 from collections import OrderedDict
+from typing import Optional
 
 import jsonschema
 import numpy
 import requests
 import vigra
 
+from lazyflow.utility.io_util.http_session import get_session
 from lazyflow.utility.io_util.multiscaleStore import MultiscaleStore, DEFAULT_SCALE_KEY
 
 logger = logging.getLogger(__file__)
@@ -76,7 +78,7 @@ class RESTfulPrecomputedChunkedVolume(MultiscaleStore):
         "required": ["type", "data_type", "num_channels", "scales"],
     }
 
-    def __init__(self, volume_url: str, n_threads=4):
+    def __init__(self, volume_url: str, n_threads=4, session: Optional[requests.Session] = None):
         """
         Args:
             volume_url (string): base url of the precomputed volume.
@@ -84,7 +86,10 @@ class RESTfulPrecomputedChunkedVolume(MultiscaleStore):
               description of the volume. Will be validated against
               `self.info_schema`.
             n_threads (int, optional): number of concurrent downloads
+            session (requests.Session, optional): session to send requests with.
+              Defaults to the shared session, which reuses connections across volumes.
         """
+        self._session = session if session is not None else get_session()
         axistags = vigra.defaultAxistags("czyx")  # neuroglancer axes are always czyx; channel might be singleton
         self._json_info = {}
         self.volume_url = volume_url
@@ -141,7 +146,7 @@ class RESTfulPrecomputedChunkedVolume(MultiscaleStore):
 
     def download_info(self):
         logger.debug(f"getting volume from {self.base_url}/info")
-        r = requests.get(f"{self.base_url}/info")
+        r = self._session.get(f"{self.base_url}/info")
 
         # check if success:
         if r.status_code != 200:
@@ -182,10 +187,9 @@ class RESTfulPrecomputedChunkedVolume(MultiscaleStore):
         else:
             raise NotImplementedError(f"encoding {encoding} not supported :(")
 
-    @staticmethod
-    def downloading(url):
+    def downloading(self, url):
         logger.debug(f"requesting {url}")
-        r = requests.get(url)
+        r = self._session.get(url)
         return r.content
 
     def generate_url(self, block_coordinates, scale=DEFAULT_SCALE_KEY):
@@ -0,0 +1,58 @@
+###############################################################################
+#   lazyflow: data flow based lazy parallel computation framework
+#
+#       Copyright (C) 2011-2024, the ilastik developers
+#                                <team@ilastik.org>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the Lesser GNU General Public License
+# as published by the Free Software Foundation; either version 2.1
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# See the files LICENSE.lgpl2 and LICENSE.lgpl3 for full text of the
+# GNU Lesser General Public License version 2.1 and 3 respectively.
+# This information is also available on the ilastik web site at:
+#          http://ilastik.org/license/
+###############################################################################
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from lazyflow.request import Request
+
+MAX_RETRIES = 3
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    # Pool size matches the number of worker threads that may download blocks concurrently
+    n_threads = max(1, Request.global_thread_pool.num_workers)
+    for prefix in ("http://", "https://"):
+        adapter = HTTPAdapter(pool_connections=n_threads, pool_maxsize=n_threads, max_retries=MAX_RETRIES)
+        session.mount(prefix, adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Shared requests.Session for web sources read via `requests` (e.g. Neuroglancer Precomputed).
+    Reusing one session keeps connections alive between requests to the same host,
+    so that only the first request pays for the TCP/TLS handshake.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _create_session()
+            atexit.register(_session.close)
+        return _session
@@ -150,34 +150,36 @@ def _match_or_create_scalings(
 
 
 def _create_empty_zarrays(
-    abs_export_path: str,
+    store: FSStore,
     export_dtype,
     chunk_shape: Shape,
     export_shape: TaggedShape,
     output_scalings: ScalingsByScaleKey,
 ) -> Tuple[OrderedDict[str, zarr.Array], OrderedDict[str, ImageMetadata]]:  #
-    store = FSStore(abs_export_path, mode="w", **OME_ZARR_V_0_4_KWARGS)
     zarrays = ODict()
     meta = ODict()
     for scale_key, scaling in output_scalings.items():
         zarrays[scale_key] = zarr.creation.zeros(
-            export_shape.values(), store=store, path=scale_key, chunks=chunk_shape, dtype=export_dtype
+            export_shape.values(),
+            store=store,
+            path=scale_key,
+            chunks=chunk_shape,
+            dtype=export_dtype,
         )
         meta[scale_key] = ImageMetadata(scale_key, scaling, ODict())
 
     return zarrays, meta
 
 
-def _scale_and_write_block(scales: ScalingsByScaleKey, zarrays: OrderedDict[str, zarr.Array], roi, data):
-    assert scales.keys() == zarrays.keys()
-    for scale_key_, scaling_ in scales.items():
-        if scaling_["x"] > 1.0 or scaling_["y"] > 1.0:
+def _check_scalings_supported(scales: ScalingsByScaleKey):
+    """Fail before anything is written, instead of checking scalings again for every block."""
+    for scaling in scales.values():
+        if scaling["x"] > 1.0 or scaling["y"] > 1.0:
             raise NotImplementedError("Downscaling is not yet implemented.")
-        else:
-            slicing = roiToSlice(*roi)
-            scaled_data = data
-        logger.info(f"Scale {scale_key_}: Writing data with shape={scaled_data.shape} to {slicing=}")
-        zarrays[scale_key_][slicing] = scaled_data
+
+
+def _write_block(zarray: zarr.Array, roi, data):
+    zarray[roiToSlice(*roi)] = data
 
 
 def _get_input_raw_absolute_scaling(input_ome_meta: Optional[OMEZarrMultiscaleMeta]) -> Optional[OrderedScaling]:
@@ -365,7 +367,7 @@ def _get_multiscale_transformations(
 
 
 def _write_ome_zarr_and_ilastik_metadata(
-    abs_export_path: str,
+    store: FSStore,
     export_meta: OrderedDict[str, ImageMetadata],
     scalings_relative_to_raw_input: Optional[ScalingsByScaleKey],
     export_offset: Optional[TaggedShape],
@@ -383,13 +385,17 @@ def _write_ome_zarr_and_ilastik_metadata(
     if multiscale_transformations:
         ome_zarr_multiscale_meta["coordinateTransformations"] = multiscale_transformations
 
-    store = FSStore(abs_export_path, mode="w", **OME_ZARR_V_0_4_KWARGS)
     root = zarr.group(store, overwrite=False)
     root.attrs["_creator"] = ilastik_signature
     root.attrs["multiscales"] = [ome_zarr_multiscale_meta]
     for image in export_meta.values():
         za = zarr.Array(store, path=image.path)
         _write_to_dataset_attrs(ilastik_meta, za)
+    try:
+        # Lets readers fetch all array and group metadata with a single request
+        zarr.consolidate_metadata(store)
+    except Exception as e:
+        logger.warning(f"Could not write consolidated metadata. The exported data should be fine. Error: {e}")
 
 
 def write_ome_zarr(
@@ -412,6 +418,7 @@ def write_ome_zarr(
     )
     op_reorder = OpReorderAxes(parent=image_source_slot.operator)
     op_reorder.AxisOrder.setValue("tczyx")
+    store = None
     try:
         op_reorder.Input.connect(image_source_slot)
         reordered_source = op_reorder.Output
@@ -426,18 +433,27 @@ def write_ome_zarr(
         export_scalings, scalings_relative_to_raw_input = _match_or_create_scalings(
             input_scales, input_scale_key, export_shape
         )
-        zarrays, export_meta = _create_empty_zarrays(
-            abs_export_path, export_dtype, chunk_shape, export_shape, export_scalings
+        _check_scalings_supported(export_scalings)
+        # One store for array creation, data and metadata, so that the underlying filesystem is set up only once
+        store = FSStore(abs_export_path, mode="w", **OME_ZARR_V_0_4_KWARGS)
+        zarrays, export_meta = _create_empty_zarrays(store, export_dtype, chunk_shape, export_shape, export_scalings)
+
+        # Blocks are written in parallel. Aligning them to chunks ensures no two blocks write to the same chunk.
+        requester = BigRequestStreamer(
+            reordered_source,
+            roiFromShape(reordered_source.meta.shape),
+            allowParallelResults=True,
+            blockMultiple=chunk_shape,
         )
-
-        requester = BigRequestStreamer(reordered_source, roiFromShape(reordered_source.meta.shape))
-        requester.resultSignal.subscribe(partial(_scale_and_write_block, export_scalings, zarrays))
+        # Downscaling is not implemented, so _check_scalings_supported only lets the export scale through
+        assert len(zarrays) == 1, f"Expected a single export scale, got {list(zarrays.keys())}"
+        requester.resultSignal.subscribe(partial(_write_block, next(iter(zarrays.values()))))
         requester.progressSignal.subscribe(progress_signal)
         requester.execute()
 
         progress_signal(95)
         _write_ome_zarr_and_ilastik_metadata(
-            abs_export_path,
+            store,
             export_meta,
             scalings_relative_to_raw_input,
             export_offset,
@@ -449,4 +465,6 @@ def write_ome_zarr(
             },
         )
     finally:
+        if store is not None:
+            store.close()
         op_reorder.cleanUp()
@@ -401,12 +401,33 @@ def globH5N5(fileObject, globString):
           matches occurred.
         - None if fileObject is not a h5 or n5 file object
     """
+    matches = globH5N5Multi(fileObject, [globString])
+    if matches is None:
+        return None
+    return matches[globString]
+
+
+def globH5N5Multi(fileObject, globStrings):
+    """
+    globs a hdf5/n5 file for several globstrings at once
+
+    Like globH5N5, but the hdf5/n5 tree is only traversed once for all globstrings.
+
+    Args:
+        fileObject: h5py.File/z5py.N5File object
+        globStrings: List of strings describing internal paths of datasets with
+            glob-like placeholders
+
+    Returns
+        - A dict mapping each globstring to a sorted list of matched object names.
+          Lists are empty for globstrings without matches.
+        - None if fileObject is not a h5 or n5 file object
+    """
     if isinstance(fileObject, (h5py.File, z5py.N5File)):
         pathlist = [x["name"] for x in lsH5N5(fileObject)]
     else:
         return None
-    matches = globList(pathlist, globString)
-    return sorted(matches)
+    return {globString: sorted(globList(pathlist, globString)) for globString in globStrings}
 
 
 def globNpz(path: str, globString: str):
@@ -415,8 +436,8 @@ def globNpz(path: str, globString: str):
 
 
 def globList(listOfPaths, globString):
-    matches = [x for x in listOfPaths if fnmatch.fnmatch(x, globString)]
-    return matches
+    # Unlike calling fnmatch.fnmatch per path, filter translates and compiles the pattern only once
+    return fnmatch.filter(listOfPaths, globString)
 
 
 def uri_to_Path(uri: str) -> pathlib.Path:
@@ -796,7 +796,7 @@ class TestOpDataSelection_FileSeriesStacks:
 
 def mock_precomputed_requests(monkeypatch, url: str, info: dict, chunks: dict[str, numpy.array]):
     """
-    Monkeypatches requests.get to mock a server hosting a precomputed dataset.
+    Monkeypatches requests.Session.get to mock a server hosting a precomputed dataset.
     Needs to be passed the monkeypatch fixture and dataset parameters.
     """
 
@@ -812,7 +812,7 @@ def mock_precomputed_requests(monkeypatch, url: str, info: dict, chunks: dict[st
             raise KeyError(f"Unknown mock url: {_url}")
         return response
 
-    monkeypatch.setattr(requests, "get", lambda _url: mock_response_for_url(_url))
+    monkeypatch.setattr(requests.Session, "get", lambda _session, _url: mock_response_for_url(_url))
 
 
 class TestOpDataSelection_PrecomputedChunks:
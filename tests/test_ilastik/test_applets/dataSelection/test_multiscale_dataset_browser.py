@@ -1,5 +1,7 @@
 import os
 import platform
+from unittest import mock
+
 import pytest
 
 from ilastik.applets.dataSelection import multiscaleDatasetBrowser
@@ -104,3 +106,40 @@ def test_validate_uri_from_existing_Windows_path_with_special_characters(tmp_pat
 def test_validate_uri_from_Windows_path_raises(invalid_input):
     with pytest.raises(ValueError):
         multiscaleDatasetBrowser._validate_uri(invalid_input)
+
+
+@pytest.fixture
+def mock_ome_zarr_store(monkeypatch):
+    store_class = mock.Mock()
+    store_class.is_uri_compatible.return_value = True
+    monkeypatch.setattr(multiscaleDatasetBrowser, "OMEZarrStore", store_class)
+    monkeypatch.setattr(multiscaleDatasetBrowser, "_PROBE_CACHE", {})
+    return store_class
+
+
+def test_probe_store_reuses_recent_result(mock_ome_zarr_store):
+    first = multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr")
+    second = multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr/")
+    assert first is second
+    mock_ome_zarr_store.assert_called_once_with("https://example.com/data.zarr")
+
+
+def test_probe_store_refetches_after_ttl(monkeypatch, mock_ome_zarr_store):
+    monkeypatch.setattr(multiscaleDatasetBrowser, "PROBE_CACHE_TTL_SECONDS", -1)
+    multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr")
+    multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr")
+    assert mock_ome_zarr_store.call_count == 2
+
+
+def test_probe_store_does_not_cache_errors(mock_ome_zarr_store):
+    mock_ome_zarr_store.side_effect = [ConnectionError(), mock.DEFAULT]
+    with pytest.raises(ConnectionError):
+        multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr")
+    assert multiscaleDatasetBrowser._probe_store("https://example.com/data.zarr") is not None
+
+
+def test_probe_store_does_not_cache_local_stores(mock_ome_zarr_store):
+    multiscaleDatasetBrowser._probe_store("file:///tmp/data.zarr")
+    multiscaleDatasetBrowser._probe_store("file:///tmp/data.zarr")
+    assert mock_ome_zarr_store.call_count == 2
+    assert multiscaleDatasetBrowser._PROBE_CACHE == {}
@@ -2,6 +2,7 @@ import unittest
 import tempfile
 import os
 import pathlib
+from unittest import mock
 
 import h5py
 import z5py
@@ -178,6 +179,90 @@ class TestOpStreamingH5N5SequenceReaderS(unittest.TestCase):
             h5_op.cleanUp()
             n5_op.cleanUp()
 
+    def test_virtual_stacker_matches_operator_stacker(self):
+        """Reading datasets directly must give the same result as stacking one reader per dataset"""
+        data = numpy.random.randint(0, 255, (7, 20, 30, 2)).astype(numpy.uint8)
+        axistags = vigra.defaultAxistags("yxc")
+        n5_file_name = f"{self.tempdir_normalized_name}/test.n5"
+        n5_file = z5py.N5File(n5_file_name, "w")
+        try:
+            for index, volume in enumerate(data):
+                n5_file.create_dataset(f"volume-{index}", data=volume, chunks=(7, 11, 2))
+                n5_file[f"volume-{index}"].attrs["axistags"] = axistags.toJSON()
+        finally:
+            n5_file.close()
+
+        for sequence_axis in ["z", "y", "x"]:
+            outputs = []
+            for use_virtual_stacker in [True, False]:
+                with mock.patch.object(OpStreamingH5N5SequenceReaderS, "USE_VIRTUAL_STACKER", use_virtual_stacker):
+                    op = OpStreamingH5N5SequenceReaderS(graph=self.graph)
+                    try:
+                        op.SequenceAxis.setValue(sequence_axis)
+                        op.GlobString.setValue(f"{n5_file_name}/volume-*")
+                        shape = op.OutputImage.meta.shape
+                        # Sub-region that starts and ends within datasets along the stacked axis
+                        start = [1 if s > 2 else 0 for s in shape]
+                        stop = [s - 1 if s > 2 else s for s in shape]
+                        outputs.append(
+                            (
+                                op.OutputImage.meta.axistags,
+                                shape,
+                                op.OutputImage.meta.dtype,
+                                op.OutputImage(start, stop).wait(),
+                            )
+                        )
+                    finally:
+                        op.cleanUp()
+            (virtual_tags, virtual_shape, virtual_dtype, virtual_data), (tags, shape, dtype, data_) = outputs
+            assert virtual_tags == tags
+            assert virtual_shape == shape
+            assert virtual_dtype == dtype
+            numpy.testing.assert_array_equal(virtual_data, data_)
+
+    def test_axistags_not_matching_shape(self):
+        n5_file_name = f"{self.tempdir_normalized_name}/test.n5"
+        n5_file = z5py.N5File(n5_file_name, "w")
+        try:
+            for index in range(3):
+                n5_file.create_dataset(f"volume-{index}", data=numpy.ones((10, 10), dtype=numpy.uint8))
+                n5_file[f"volume-{index}"].attrs["axistags"] = vigra.defaultAxistags("yxc").toJSON()
+        finally:
+            n5_file.close()
+
+        op = OpStreamingH5N5SequenceReaderS(graph=self.graph)
+        try:
+            with self.assertRaises(AssertionError):
+                op.GlobString.setValue(f"{n5_file_name}/volume-*")
+        finally:
+            op.cleanUp()
+
+    def test_glob_expanded_only_when_glob_string_changes(self):
+        n5_file_name = f"{self.tempdir_normalized_name}/test.n5"
+        n5_file = z5py.N5File(n5_file_name, "w")
+        try:
+            for index in range(3):
+                n5_file.create_dataset(f"volume-{index}", data=numpy.ones((10, 10, 10), dtype=numpy.uint8))
+        finally:
+            n5_file.close()
+
+        expand = OpStreamingH5N5SequenceReaderS.expandGlobStrings
+        with mock.patch.object(OpStreamingH5N5SequenceReaderS, "expandGlobStrings", side_effect=expand) as expand_mock:
+            op = OpStreamingH5N5SequenceReaderS(graph=self.graph)
+            try:
+                op.GlobString.setValue(f"{n5_file_name}/volume-*")
+                op.SequenceAxis.setValue("z")
+                assert op.OutputImage.meta.shape == (30, 10, 10)
+                op.SequenceAxis.setValue("t")
+                assert op.OutputImage.meta.shape == (3, 10, 10, 10)
+                assert expand_mock.call_count == 1
+
+                op.GlobString.setValue(f"{n5_file_name}/volume-[01]")
+                assert op.OutputImage.meta.shape == (2, 10, 10, 10)
+                assert expand_mock.call_count == 2
+            finally:
+                op.cleanUp()
+
     def test_globStringValidity(self):
         """Check whether globStrings are correctly verified"""
         testGlobString = "/tmp/test.h5"
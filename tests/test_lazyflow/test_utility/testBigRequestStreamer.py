@@ -119,6 +119,22 @@ class TestBigRequestStreamer(unittest.TestCase):
         logger.debug("FINISHED")
 
 
+def test_block_multiple():
+    op = OpArrayPiper(graph=Graph())
+    op.Input.setValue(numpy.indices((100, 100)).sum(0))
+    op.Output.meta.max_blockshape = (13, 17)
+    rois = []
+
+    batch = BigRequestStreamer(op.Output, [(0, 0), (100, 100)], blockMultiple=(10, 20))
+    batch.resultSignal.subscribe(lambda roi, result: rois.append(roi))
+    batch.execute()
+
+    assert len(rois) > 1
+    for start, stop in rois:
+        assert start[0] % 10 == 0 and start[1] % 20 == 0
+        assert stop[0] % 10 == 0 and stop[1] % 20 == 0
+
+
 def test_pool_results_discarded():
     """
     This test checks to make sure that result arrays are discarded in turn as the BigRequestStreamer executes.
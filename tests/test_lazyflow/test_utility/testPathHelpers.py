@@ -30,6 +30,7 @@ from lazyflow.utility.pathHelpers import (
     getPathVariants,
     PathComponents,
     globH5N5,
+    globH5N5Multi,
     splitPath,
     isUrl,
 )
@@ -136,6 +137,18 @@ class TestPathHelpers(object):
         globbedPaths = globH5N5(hdf5File, globString)
         assert all([a == b for a, b in zip(globbedPaths, expectedPaths)])
 
+    def testHdf5GlobMulti(self):
+        hdf5File = self.createHdf5Data()
+
+        globStrings = ["this/is/also/some/data/test-0[34]", "here/is/the/data/test-0[1]", "nothing/here/*"]
+
+        globbedPaths = globH5N5Multi(hdf5File, globStrings)
+        assert globbedPaths == {
+            "this/is/also/some/data/test-0[34]": ["this/is/also/some/data/test-03", "this/is/also/some/data/test-04"],
+            "here/is/the/data/test-0[1]": ["here/is/the/data/test-01"],
+            "nothing/here/*": [],
+        }
+
     def createHdf5Data(self):
         """Creates Hdf5 file in memory for testHff5Glob"""
         f = h5py.File(name="test", driver="core", backing_store=False, mode="a")
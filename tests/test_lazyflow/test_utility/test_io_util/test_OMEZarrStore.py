@@ -20,14 +20,21 @@
 # 		   http://ilastik.org/license/
 ###############################################################################
 import asyncio
+import json
 from unittest import mock
 
 import fsspec.implementations.http
+import numpy
 import pytest
 import s3fs
+import zarr
 from aiohttp import ClientResponseError
 
-from lazyflow.utility.io_util.OMEZarrStore import OMEZarrStore, NoOMEZarrMetaFound
+from lazyflow.utility.io_util.OMEZarrStore import (
+    OME_ZARR_V_0_4_KWARGS,
+    OMEZarrStore,
+    NoOMEZarrMetaFound,
+)
 
 
 def test_handles_wrapped_connection_error(monkeypatch):
@@ -74,3 +81,39 @@ def test_maps_https_scheme_to_s3fs_on_403(count_s3fs_instances, mock_httpfs_403)
     with pytest.raises(NoOMEZarrMetaFound):
         OMEZarrStore(f"https://localhost/bucket/some.zarr")
     assert s3fs.core.S3FileSystem.instance_counter == 1
+
+
+def test_fetches_zattrs_only_once(tmp_path, monkeypatch):
+    spec = {
+        "multiscales": [
+            {
+                "version": "0.4",
+                "axes": [{"type": "space", "name": "y"}, {"type": "space", "name": "x"}],
+                "datasets": [
+                    {"path": "s0", "coordinateTransformations": [{"scale": [1.0, 1.0], "type": "scale"}]},
+                ],
+            }
+        ]
+    }
+    store_path = tmp_path / "test.zarr"
+    store_path.mkdir()
+    (store_path / ".zattrs").write_text(json.dumps(spec))
+    zarr.array(
+        numpy.zeros((10, 10), dtype=numpy.uint8),
+        chunks=(5, 5),
+        store=zarr.DirectoryStore(str(store_path / "s0")),
+        **OME_ZARR_V_0_4_KWARGS,
+    )
+    requested_keys = []
+    fsstore_getitem = zarr.storage.FSStore.__getitem__
+
+    def track_getitem(self, key):
+        requested_keys.append(key)
+        return fsstore_getitem(self, key)
+
+    monkeypatch.setattr(zarr.storage.FSStore, "__getitem__", track_getitem)
+
+    store = OMEZarrStore(store_path.as_uri())
+
+    assert store.get_shape("s0") == (10, 10)
+    assert requested_keys.count(".zattrs") == 1
@@ -0,0 +1,45 @@
+import json
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from lazyflow.request import Request
+from lazyflow.utility.io_util.http_session import get_session
+from lazyflow.utility.io_util.RESTfulPrecomputedChunkedVolume import RESTfulPrecomputedChunkedVolume
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
+def test_session_uses_pooled_adapters():
+    session = get_session()
+    expected_pool_size = max(1, Request.global_thread_pool.num_workers)
+    for url in ("http://example.com", "https://example.com"):
+        adapter = session.get_adapter(url)
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == expected_pool_size
+        assert adapter.max_retries.total > 0
+
+
+def test_precomputed_volume_uses_injected_session():
+    info = {
+        "type": "image",
+        "data_type": "uint8",
+        "num_channels": 1,
+        "scales": [{"key": "s0", "size": [4, 4, 4], "chunk_sizes": [[4, 4, 4]], "encoding": "raw"}],
+    }
+    session = mock.Mock(spec=requests.Session)
+    session.get.side_effect = [
+        mock.Mock(status_code=200, content=json.dumps(info).encode()),
+        mock.Mock(status_code=200, content=b"block"),
+    ]
+
+    volume = RESTfulPrecomputedChunkedVolume("precomputed://http://localhost/volume", session=session)
+    assert volume.downloading("http://localhost/volume/s0/0-4_0-4_0-4") == b"block"
+
+    assert [c.args[0] for c in session.get.call_args_list] == [
+        "http://localhost/volume/info",
+        "http://localhost/volume/s0/0-4_0-4_0-4",
+    ]
@@ -10,6 +10,7 @@ import zarr
 from lazyflow.operators import OpArrayPiper
 from lazyflow.roi import roiToSlice
 from lazyflow.utility.io_util import multiscaleStore
+from lazyflow.utility.io_util import write_ome_zarr as write_ome_zarr_module
 from lazyflow.utility.io_util.OMEZarrStore import OMEZarrMultiscaleMeta
 from lazyflow.utility.io_util.write_ome_zarr import write_ome_zarr
 
@@ -66,6 +67,41 @@ def test_metadata_integrity(tmp_path, graph, shape, axes):
         assert written_array.shape == expected_shape
         assert numpy.count_nonzero(written_array) > numpy.prod(expected_shape) / 2, "did not write actual data"
     assert all([key in discovered_keys for key in group.keys()]), "store contains undocumented subpaths"
+    consolidated = zarr.open_consolidated(str(export_path))
+    assert consolidated.attrs["multiscales"] == group.attrs["multiscales"]
+
+
+def test_aligns_blocks_to_chunks(tmp_path, graph, monkeypatch):
+    """Blocks are written in parallel, so no two blocks may write to the same chunk,
+    even if the source suggests a blockshape that does not match the chunks."""
+    data_shape = (1, 1, 10, 300, 301)
+    data = vigra.VigraArray(data_shape, axistags=vigra.defaultAxistags("tczyx"))
+    data[...] = numpy.indices(data_shape).sum(0)
+    export_path = tmp_path / "test.zarr"
+    source_op = OpArrayPiper(graph=graph)
+    source_op.Input.setValue(data)
+    source_op.Output.meta.max_blockshape = (1, 1, 3, 71, 53)
+    progress = mock.Mock()
+    written_rois = []
+    write_block = write_ome_zarr_module._write_block
+
+    def track_write_block(zarray, roi, block):
+        written_rois.append(roi)
+        write_block(zarray, roi, block)
+
+    monkeypatch.setattr(write_ome_zarr_module, "_write_block", track_write_block)
+
+    write_ome_zarr(str(export_path), source_op.Output, None, progress)
+
+    group = zarr.open(str(export_path))
+    dataset_path = group.attrs["multiscales"][0]["datasets"][0]["path"]
+    chunks = group[dataset_path].chunks
+    assert chunks != (1, 1, 3, 71, 53)
+    assert len(written_rois) > 1
+    for start, stop in written_rois:
+        assert all(s % c == 0 for s, c in zip(start, chunks))
+        assert all(e % c == 0 or e == full for e, c, full in zip(stop, chunks, data_shape))
+    numpy.testing.assert_array_equal(group[dataset_path], data)
 
 
 @pytest.mark.skip("To be implemented after releasing single-scale export")